@@ -1,16 +1,22 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
+import csv
 import os
 from datetime import datetime
 
+from data import bucket_officers, load_dashboard_df
+
 # ---- Page config ----
 st.set_page_config(page_title="Officer Collection Dashboard", layout="wide")
 
 # ---- Helper: load/normalize messages CSV ----
-def load_messages_csv(path):
+@st.cache_data
+def load_messages_csv(path, mtime):
     """
     Load messages CSV and normalize column names to: Name, Message, Timestamp.
     Works even if older CSV used columns like 'officer','message','timestamp' etc.
+    Cached per (path, mtime) so reruns skip the disk read until the file changes.
     """
     if not os.path.exists(path):
         return pd.DataFrame(columns=["Name", "Message", "Timestamp"])
@@ -67,65 +73,14 @@ if menu == "Dashboard":
         unsafe_allow_html=True
     )
 
-    # ---- Load Data ----
+    # ---- Load Data (cached) ----
     DATA_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vR-21kv5EFe1-Vp9TiY1GxsazJcG2fZj6qQ-24Z9Cveco76E22SDRbAya9s8PMPYXb-IvR8LdcOIFgd/pub?gid=421148399&single=true&output=csv"
-    df = pd.read_csv(DATA_URL)
-
-    # ---- Clean officer names ----
-    df["officer"] = df["officer"].astype(str).str.strip().str.title()
-
-    # ---- Identify Repaid columns dynamically (exclude 'repaid_amounts') ----
-    repaid_cols = [
-        col for col in df.columns
-        if col.lower().startswith("repaid") and col.lower() != "repaid_amounts"
-    ]
-
-    # ---- Convert repaid columns to numeric ----
-    for col in repaid_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-
-    # ---- Total repaid per row ----
-    df["total_repaid"] = df[repaid_cols].sum(axis=1)
-
-    # ---- Auto-detect days_late column (exclude days_late_lastinstallment) ----
-    days_late_col = None
-    for col in df.columns:
-        if "days" in col.lower() and "late" in col.lower() and col.lower() != "days_late_lastinstallment":
-            days_late_col = col
-            break
+    df, repaid_cols, days_late_col = load_dashboard_df(DATA_URL)
 
     if not days_late_col:
         st.error("No valid 'days_late' column found.")
         st.stop()
 
-    # ---- Define bucket function ----
-    def bucket_days_late(x):
-        if pd.isna(x):
-            return "Unknown"
-        try:
-            x = int(x)
-        except Exception:
-            return "Unknown"
-        if x <= 30:
-            return "1-30"
-        elif x <= 60:
-            return "31-60"
-        elif x <= 90:
-            return "61-90"
-        else:
-            return "90+"
-
-    df["days_late_bucket"] = df[days_late_col].apply(bucket_days_late)
-
-    # ---- Define officer-bucket mapping ----
-    bucket_officers_raw = {
-        "1-30": ["Dennis", "Moses", "Lydia"],
-        "31-60": ["Josline", "Kennedy"],
-        "61-90": ["Nyamisa", "Waswa"],
-        "90+": []
-    }
-    bucket_officers = {b: [name.strip().title() for name in names] for b, names in bucket_officers_raw.items()}
-
     # ---- Sidebar Filters ----
     st.sidebar.header("Filters")
     chosen_bucket = st.sidebar.selectbox("Select Days Late Bucket", ["All", "1-30", "31-60", "61-90", "90+"])
@@ -141,17 +96,16 @@ if menu == "Dashboard":
     if chosen_bucket == "All":
         filtered_df = df.copy()
     else:
-        allowed_officers = bucket_officers.get(chosen_bucket, [])
         filtered_df = df[
             (df["days_late_bucket"] == chosen_bucket)
-            & (df["officer"].isin(allowed_officers))
+            & (df["assigned_bucket"] == chosen_bucket)
         ]
 
     # ============================
     # 📊 Officer Summary (Bucket Totals + Top/Lowest)
     # ============================
     officer_summary = (
-        filtered_df.groupby(["officer", "days_late_bucket"])["total_repaid"]
+        filtered_df.groupby(["officer", "days_late_bucket"], observed=True)["total_repaid"]
         .sum()
         .reset_index()
     )
@@ -163,42 +117,46 @@ if menu == "Dashboard":
         summary_display = officer_summary.rename(
             columns={"officer": "Officer", "days_late_bucket": "Bucket", "total_repaid": "Total Repaid"}
         )
-        summary_display["Total Repaid"] = summary_display["Total Repaid"].map("{:,.2f}".format)
-        st.dataframe(summary_display, use_container_width=True)
+        st.dataframe(
+            summary_display.style.format({"Total Repaid": "{:,.2f}"}),
+            use_container_width=True
+        )
 
         # ---- Bucket Totals (with Grand Total row) ----
-        bucket_totals = officer_summary.groupby("days_late_bucket")["total_repaid"].sum().reset_index()
+        bucket_totals = officer_summary.groupby("days_late_bucket", observed=True)["total_repaid"].sum().reset_index()
         grand_total = bucket_totals["total_repaid"].sum()
         bucket_totals = pd.concat(
             [bucket_totals, pd.DataFrame([{"days_late_bucket": "Grand Total", "total_repaid": grand_total}])]
         )
-        bucket_totals["total_repaid"] = bucket_totals["total_repaid"].map("{:,.2f}".format)
 
         st.markdown("### 📦 Bucket Totals")
         st.dataframe(
-            bucket_totals.rename(columns={"days_late_bucket": "Bucket", "total_repaid": "Total Collected"}),
+            bucket_totals.rename(columns={"days_late_bucket": "Bucket", "total_repaid": "Total Collected"})
+            .style.format({"Total Collected": "{:,.2f}"}),
             use_container_width=True
         )
 
         # ---- Top & Lowest Collector per Bucket ----
         st.markdown("### 🏆 Top & Lowest Collectors per Bucket")
-        top_lowest_list = []
-        for bucket, group in officer_summary.groupby("days_late_bucket"):
-            assigned = bucket_officers.get(bucket, [])
-            group = group[group["officer"].isin(assigned)]
-            if not group.empty:
-                top_row = group.loc[group["total_repaid"].idxmax()]
-                low_row = group.loc[group["total_repaid"].idxmin()]
-                top_lowest_list.append({
-                    "Bucket": bucket,
-                    "Top Collector": top_row["officer"],
-                    "Top Amount": top_row["total_repaid"],
-                    "Lowest Collector": low_row["officer"],
-                    "Lowest Amount": low_row["total_repaid"]
-                })
-
-        if top_lowest_list:
-            top_lowest_df = pd.DataFrame(top_lowest_list)
+        # Restrict to assigned officers via a merge, then find top/lowest for
+        # all buckets in one grouped pass instead of looping bucket by bucket.
+        assigned_pairs = pd.DataFrame(
+            [(b, o) for b, names in bucket_officers.items() for o in names],
+            columns=["days_late_bucket", "officer"]
+        )
+        eligible = officer_summary.merge(assigned_pairs, on=["days_late_bucket", "officer"])
+
+        if not eligible.empty:
+            extremes = eligible.groupby("days_late_bucket", observed=True)["total_repaid"].agg(["idxmax", "idxmin"])
+            top_rows = eligible.loc[extremes["idxmax"]].reset_index(drop=True)
+            low_rows = eligible.loc[extremes["idxmin"]].reset_index(drop=True)
+            top_lowest_df = pd.DataFrame({
+                "Bucket": top_rows["days_late_bucket"],
+                "Top Collector": top_rows["officer"],
+                "Top Amount": top_rows["total_repaid"],
+                "Lowest Collector": low_rows["officer"],
+                "Lowest Amount": low_rows["total_repaid"]
+            })
             st.dataframe(top_lowest_df.style.format({
                 "Top Amount": "{:,.2f}",
                 "Lowest Amount": "{:,.2f}"
@@ -220,15 +178,19 @@ if menu == "Dashboard":
                 .rename(columns={days_late_col: "Days Late", "total_repaid": "Total Repaid"})
                 .sort_values("Days Late")
             )
-            days_summary["Total Repaid"] = days_summary["Total Repaid"].map("{:,.2f}".format)
             st.markdown("### 📊 Officer Collections by Days Late")
-            st.dataframe(days_summary, use_container_width=True)
+            st.dataframe(
+                days_summary.style.format({"Total Repaid": "{:,.2f}"}),
+                use_container_width=True
+            )
 
             # ---- Customer Drilldown ----
-            unique_days = sorted(officer_data[days_late_col].dropna().unique())
+            # np.unique sorts in C; no Python-level sorted() over boxed scalars
+            days_arr = officer_data[days_late_col].to_numpy(dtype=float)
+            unique_days = np.unique(days_arr[~np.isnan(days_arr)])
             chosen_day = st.selectbox(
                 f"View {selected_officer}'s Accounts by Days Late",
-                ["All"] + [str(int(d)) for d in unique_days]
+                ["All"] + unique_days.astype(int).astype(str).tolist()
             )
             officer_accounts = officer_data.copy()
             if chosen_day != "All":
@@ -238,23 +200,23 @@ if menu == "Dashboard":
                 customer_view = officer_accounts[
                     ["customer_id", "customer_names", days_late_col, "total_repaid"] + repaid_cols
                 ].sort_values(by=days_late_col)
-                for col in ["total_repaid"] + repaid_cols:
-                    if col in customer_view.columns:
-                        customer_view[col] = customer_view[col].map("{:,.2f}".format)
-                st.dataframe(customer_view, use_container_width=True)
+                money_fmt = {
+                    col: "{:,.2f}" for col in ["total_repaid"] + repaid_cols
+                    if col in customer_view.columns
+                }
+                st.dataframe(customer_view.style.format(money_fmt), use_container_width=True)
 
             # ---- Officer Collections by Repaid Date ----
-            repaid_date_totals = officer_data[["officer"] + repaid_cols].melt(
-                id_vars="officer", var_name="Repaid Date", value_name="Amount"
-            )
-            repaid_date_totals = (
-                repaid_date_totals.groupby(["officer", "Repaid Date"])["Amount"]
-                .sum()
-                .reset_index()
-            )
-            repaid_date_totals["Amount"] = repaid_date_totals["Amount"].map("{:,.2f}".format)
+            # Only one officer is drilled down, so the melt + groupby reduces to
+            # a plain per-column sum of the repaid columns
+            sums = officer_data[repaid_cols].sum()
+            repaid_date_totals = sums.rename_axis("Repaid Date").reset_index(name="Amount")
+            repaid_date_totals.insert(0, "officer", selected_officer)
             st.markdown("### 📅 Officer Collections by Repaid Date")
-            st.dataframe(repaid_date_totals, use_container_width=True)
+            st.dataframe(
+                repaid_date_totals.style.format({"Amount": "{:,.2f}"}),
+                use_container_width=True
+            )
 
 # =========================
 # 💬 Team Sharing Page
@@ -264,8 +226,11 @@ elif menu == "💬 Team Sharing: What's Working":
 
     CSV_FILE = "team_messages.csv"
 
-    # Load and normalize messages
-    messages = load_messages_csv(CSV_FILE)
+    # Seed the in-session message list from disk once; after that, posts are
+    # appended to the list and the CSV is only touched to persist them.
+    if "messages" not in st.session_state:
+        csv_mtime = os.path.getmtime(CSV_FILE) if os.path.exists(CSV_FILE) else 0
+        st.session_state.messages = load_messages_csv(CSV_FILE, csv_mtime).to_dict("records")
 
     # Post form
     with st.form("message_form", clear_on_submit=True):
@@ -278,29 +243,38 @@ elif menu == "💬 Team Sharing: What's Working":
             st.warning("Please enter both your name and a message before posting.")
         else:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_msg = pd.DataFrame([{
+            new_msg = {
                 "Name": name.strip().title(),
                 "Message": message.strip(),
                 "Timestamp": timestamp
-            }])
-            messages = pd.concat([messages, new_msg], ignore_index=True)
-            # ensure canonical order and save
-            messages = messages[["Name", "Message", "Timestamp"]]
-            messages.to_csv(CSV_FILE, index=False)
+            }
+            st.session_state.messages.append(new_msg)
+            # Persist by appending one row; no full-history rewrite needed.
+            write_header = not os.path.exists(CSV_FILE) or os.path.getsize(CSV_FILE) == 0
+            with open(CSV_FILE, "a", newline="") as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(["Name", "Message", "Timestamp"])
+                writer.writerow([new_msg["Name"], new_msg["Message"], new_msg["Timestamp"]])
             st.success("✅ Message posted!")
             st.experimental_rerun()
 
     # Display latest messages (most recent first)
-    if not messages.empty:
-        # attempt to parse timestamps for sorting (silently ignore parse errors)
-        try:
-            messages["__ts"] = pd.to_datetime(messages["Timestamp"], errors="coerce")
-            messages = messages.sort_values("__ts", ascending=False).drop(columns="__ts")
-        except Exception:
-            pass
+    if st.session_state.messages:
+        # timestamps are written as "%Y-%m-%d %H:%M:%S", so lexicographic order
+        # is chronological — no datetime parsing needed; rows with a missing
+        # timestamp sink to the bottom
+        def _msg_key(msg):
+            ts = msg.get("Timestamp")
+            return ts if isinstance(ts, str) else ""
+
+        ordered = sorted(st.session_state.messages, key=_msg_key, reverse=True)
 
         st.write("### 📌 Team Messages")
-        for _, row in messages.iterrows():
-            st.markdown(f"**{row['Name']}** ({row['Timestamp']}):  \n{row['Message']}")
+        # Join into one markdown blob — one st.markdown call regardless of count
+        text = "\n\n".join(
+            f"**{m['Name']}** ({m['Timestamp']}):  \n{m['Message']}" for m in ordered
+        )
+        st.markdown(text)
     else:
         st.info("No messages yet — be the first to share what's working!")
@@ -1,7 +1,7 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
+from data import load_data
+
 # ---- Page config ----
 st.set_page_config(page_title="Officer Collection Dashboard", layout="wide")
 
@@ -27,64 +27,6 @@ st.sidebar.title("Dashboard")
 page = st.sidebar.radio("Go to", ["Overview", "Officer Data", "Graphs"])
 sheet_choice = st.sidebar.selectbox("Select sheet", list(SHEETS.keys()))
 
-# ----------------------------
-# Load Google Sheet Data
-# ----------------------------
-@st.cache_data(ttl=30)
-def load_data(gid, sheet_choice):
-    url = f"https://docs.google.com/spreadsheets/d/1r6RdJKrcQbDu219vobz6cnUMe8Bt_fvODLbUJG739NQ/export?format=csv&gid={gid}"
-    df = pd.read_csv(url)
-    df.columns = df.columns.str.strip()
-
-    # ---- Special handling for POCHI ----
-    if sheet_choice == "Pochi":
-        # Normalize officer column
-        if "officer" in df.columns:
-            df.rename(columns={"officer": "Officer"}, inplace=True)
-        else:
-            df.rename(columns={df.columns[0]: "Officer"}, inplace=True)
-
-        # Ensure numeric conversions
-        for col in ["days_late", "total_due", "repaid_amounts"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(
-                    df[col].apply(lambda x: str(x).replace(",", "").strip()),
-                    errors="coerce"
-                )
-
-        # Compute Amount Collected = total_due - repaid_amounts
-        if "total_due" in df.columns and "repaid_amounts" in df.columns:
-            df["Amount Collected"] = df["total_due"] - df["repaid_amounts"]
-        else:
-            df["Amount Collected"] = pd.to_numeric(0, errors="coerce")
-
-        # Define buckets from days_late
-        bins = [0, 30, 60, 90, float("inf")]
-        labels = ["1-30", "31-60", "61-90", "90+"]
-        if "days_late" in df.columns:
-            df["Bucket"] = pd.cut(df["days_late"], bins=bins, labels=labels, right=True)
-        else:
-            df["Bucket"] = "Unknown"
-
-        # Group by Officer + Bucket
-        df = df.groupby(["Officer", "Bucket"], as_index=False)[["Amount Collected"]].sum()
-
-    else:
-        # Standard officer collection sheets
-        df.rename(columns={df.columns[0]: "Officer"}, inplace=True)
-        numeric_cols = [c for c in df.columns if c != "Officer"]
-
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(
-                df[col].apply(lambda x: str(x).replace(",", "").strip()), errors="coerce"
-            )
-
-        df["Amount Collected"] = df[numeric_cols].sum(axis=1)
-        df = df.groupby("Officer", as_index=False)[["Amount Collected"]].sum()
-        df["Bucket"] = "All"  # placeholder for consistency
-
-    return df
-
 # ----------------------------
 # Load selected sheet
 # ----------------------------
@@ -134,6 +76,10 @@ elif page == "Officer Data":
 elif page == "Graphs":
     st.subheader(f"📊 Graphs – {sheet_choice}")
 
+    # matplotlib import is deferred to here so the other pages don't pay
+    # its import cost on cold start
+    import matplotlib.pyplot as plt
+
     if not filtered_df.empty:
         if sheet_choice == "Pochi":
             # Pivot buckets by officer for stacked bar chart
@@ -149,9 +95,8 @@ elif page == "Graphs":
         else:
             fig, ax = plt.subplots(figsize=(12, 6))
             bars = ax.bar(filtered_df["Officer"], filtered_df["Amount Collected"], color="lightblue", edgecolor="black")
-            for bar, total in zip(bars, filtered_df["Amount Collected"]):
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height()/2, f"{int(total):,}",
-                        ha="center", va="center", fontsize=9, fontweight="bold")
+            ax.bar_label(bars, labels=[f"{int(total):,}" for total in filtered_df["Amount Collected"]],
+                         label_type="center", fontsize=9, fontweight="bold")
             ax.set_ylabel("Amount Collected (Ksh)")
             ax.set_title(f"Total Amount Collected per Officer – {sheet_choice}")
             plt.xticks(rotation=45, ha="right")
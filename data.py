@@ -0,0 +1,220 @@
+import csv
+import io
+
+import numpy as np
+import pandas as pd
+import requests
+import streamlit as st
+
+# numba is optional: with it installed the repaid-sum and days-late bucketing
+# fuse into a single parallel pass; without it we fall back to NumPy + pd.cut
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+BUCKET_LABELS = ["1-30", "31-60", "61-90", "90+", "Unknown"]
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _total_and_bucket(repaid_2d, days_late):
+        """Fused kernel: row sum of repaid columns + bucket code, one memory pass."""
+        n = repaid_2d.shape[0]
+        total = np.empty(n, np.float32)
+        bucket = np.empty(n, np.int8)
+        for i in prange(n):
+            s = np.float32(0.0)
+            for j in range(repaid_2d.shape[1]):
+                v = repaid_2d[i, j]
+                if v == v:  # skip NaN
+                    s += v
+            total[i] = s
+            d = days_late[i]
+            if d != d:  # NaN -> Unknown
+                bucket[i] = 4
+            elif d <= 30:
+                bucket[i] = 0
+            elif d <= 60:
+                bucket[i] = 1
+            elif d <= 90:
+                bucket[i] = 2
+            else:
+                bucket[i] = 3
+        return total, bucket
+
+# ---- Officer-bucket assignments ----
+bucket_officers_raw = {
+    "1-30": ["Dennis", "Moses", "Lydia"],
+    "31-60": ["Josline", "Kennedy"],
+    "61-90": ["Nyamisa", "Waswa"],
+    "90+": []
+}
+bucket_officers = {b: [name.strip().title() for name in names] for b, names in bucket_officers_raw.items()}
+# reverse map: officer -> assigned bucket
+officer_bucket = {officer: b for b, names in bucket_officers.items() for officer in names}
+
+
+# ---- Shared HTTP session ----
+@st.cache_resource
+def http_session():
+    """
+    One pooled requests.Session for the whole app, so cold cache misses reuse
+    the existing keep-alive connection instead of a fresh TLS handshake.
+    """
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+# ---- Loader for app.py (Pochi collections sheet) ----
+@st.cache_data(ttl=300)
+def load_dashboard_df(url):
+    """
+    Fetch the Google Sheets CSV and run all the one-off cleanup so reruns
+    (filter clicks, navigation) hit the in-memory cache instead of the network.
+    Returns (df, repaid_cols, days_late_col); days_late_col is None if missing.
+    """
+    # the pooled session negotiates gzip with Google's export endpoint,
+    # cutting the bytes on the wire ~5x vs pandas' plain urllib fetch
+    resp = http_session().get(url, timeout=15)
+    resp.raise_for_status()
+    # Only parse the columns the dashboard actually uses, with known dtypes,
+    # instead of loading and type-inferring the whole sheet. The pyarrow
+    # engine needs an explicit column list (no callables), so resolve the
+    # wanted columns against the header line first.
+    header = resp.content.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r")
+    wanted_cols = [
+        c for c in next(csv.reader([header]))
+        if c == "officer"
+        or c.startswith("customer_")
+        or "days_late" in c.lower()
+        or c.lower().startswith("repaid")
+    ]
+    df = pd.read_csv(
+        io.BytesIO(resp.content),
+        engine="pyarrow",
+        usecols=wanted_cols,
+        dtype={"officer": "string", "customer_id": "string", "customer_names": "string"}
+    )
+
+    # Clean officer names; category dtype makes the repeated groupby/isin/unique
+    # calls below much cheaper than object-dtype strings
+    df["officer"] = df["officer"].astype(str).str.strip().str.title().astype("category")
+
+    # Identify Repaid columns dynamically (exclude 'repaid_amounts')
+    repaid_cols = [
+        col for col in df.columns
+        if col.lower().startswith("repaid") and col.lower() != "repaid_amounts"
+    ]
+
+    # Convert repaid columns to numeric (float32 halves the bytes moved for
+    # these money columns and is plenty of precision for display)
+    for col in repaid_cols:
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(np.float32)
+
+    # Auto-detect days_late column (exclude days_late_lastinstallment)
+    days_late_col = None
+    for col in df.columns:
+        if "days" in col.lower() and "late" in col.lower() and col.lower() != "days_late_lastinstallment":
+            days_late_col = col
+            break
+
+    repaid_arr = df[repaid_cols].to_numpy(dtype=np.float32, copy=False)
+
+    if not days_late_col:
+        df["total_repaid"] = repaid_arr.sum(axis=1)
+        return df, repaid_cols, None
+
+    days_late = pd.to_numeric(df[days_late_col], errors="coerce")
+
+    if HAS_NUMBA:
+        # Fused kernel: total_repaid and bucket codes in one parallel pass
+        # over the float32 arrays, then map codes back to the labels
+        total, codes = _total_and_bucket(repaid_arr, days_late.to_numpy(dtype=np.float32))
+        df["total_repaid"] = total
+        df["days_late_bucket"] = pd.Categorical.from_codes(codes, categories=BUCKET_LABELS, ordered=True)
+    else:
+        # Total repaid per row: one contiguous NumPy reduction instead of a
+        # per-column pandas sum
+        df["total_repaid"] = repaid_arr.sum(axis=1)
+
+        # Bucket days late (vectorized, same pattern as the Pochi branch in dashboard.py)
+        df["days_late_bucket"] = (
+            pd.cut(
+                days_late,
+                bins=[-np.inf, 30, 60, 90, np.inf],
+                labels=BUCKET_LABELS[:4]
+            )
+            .cat.add_categories("Unknown")
+            .fillna("Unknown")
+        )
+
+    # Preassigned bucket per officer, so filtering is a single categorical
+    # equality instead of isin over a Python list on every rerun
+    df["assigned_bucket"] = df["officer"].map(officer_bucket).astype("category")
+    return df, repaid_cols, days_late_col
+
+
+# ---- Loader for dashboard.py (per-sheet officer collections) ----
+@st.cache_data(ttl=30)
+def load_data(gid, sheet_choice):
+    url = f"https://docs.google.com/spreadsheets/d/1r6RdJKrcQbDu219vobz6cnUMe8Bt_fvODLbUJG739NQ/export?format=csv&gid={gid}"
+    resp = http_session().get(url, timeout=15)
+    resp.raise_for_status()
+    df = pd.read_csv(io.BytesIO(resp.content))
+    df.columns = df.columns.str.strip()
+
+    # ---- Special handling for POCHI ----
+    if sheet_choice == "Pochi":
+        # Normalize officer column
+        if "officer" in df.columns:
+            df.rename(columns={"officer": "Officer"}, inplace=True)
+        else:
+            df.rename(columns={df.columns[0]: "Officer"}, inplace=True)
+
+        # Ensure numeric conversions
+        for col in ["days_late", "total_due", "repaid_amounts"]:
+            if col in df.columns:
+                df[col] = pd.to_numeric(
+                    df[col].astype(str).str.replace(",", "", regex=False).str.strip(),
+                    errors="coerce"
+                )
+
+        # Compute Amount Collected = total_due - repaid_amounts
+        if "total_due" in df.columns and "repaid_amounts" in df.columns:
+            df["Amount Collected"] = df["total_due"] - df["repaid_amounts"]
+        else:
+            df["Amount Collected"] = pd.to_numeric(0, errors="coerce")
+
+        # Define buckets from days_late
+        bins = [0, 30, 60, 90, float("inf")]
+        labels = ["1-30", "31-60", "61-90", "90+"]
+        if "days_late" in df.columns:
+            df["Bucket"] = pd.cut(df["days_late"], bins=bins, labels=labels, right=True)
+        else:
+            df["Bucket"] = "Unknown"
+
+        # Category dtype: cheap repeated isin/unique/groupby on a low-cardinality key
+        df["Officer"] = df["Officer"].astype("category")
+
+        # Group by Officer + Bucket (observed=False keeps empty buckets, as before)
+        df = df.groupby(["Officer", "Bucket"], as_index=False, observed=False)[["Amount Collected"]].sum()
+
+    else:
+        # Standard officer collection sheets
+        df.rename(columns={df.columns[0]: "Officer"}, inplace=True)
+        numeric_cols = [c for c in df.columns if c != "Officer"]
+
+        for col in numeric_cols:
+            df[col] = pd.to_numeric(
+                df[col].astype(str).str.replace(",", "", regex=False).str.strip(),
+                errors="coerce"
+            )
+
+        df["Amount Collected"] = df[numeric_cols].sum(axis=1)
+        df["Officer"] = df["Officer"].astype("category")
+        df = df.groupby("Officer", as_index=False, observed=True)[["Amount Collected"]].sum()
+        df["Bucket"] = pd.Categorical(["All"] * len(df))  # placeholder for consistency
+
+    return df